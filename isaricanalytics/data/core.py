@@ -12,13 +12,19 @@ The `IsaricData` class has methods to:
 """
 
 import json
+import re
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Union
 
 import pandas as pd
 
-from isaricanalytics.utils import sanitise_string
+# Field names must already be sanitised (see `sanitise_string`) and start with a letter
+_FIELD_NAME_RE = re.compile(r"[a-z][0-9a-z_]*")
+
+# Low-cardinality data_dictionary columns that are repeatedly compared against.
+# field_name is left as is, since it is unique and edited in place.
+_CATEGORY_COLUMNS = ("table_name", "field_type")
 
 
 @dataclass
@@ -33,8 +39,21 @@ class IsaricData:
     daily: Optional[pd.DataFrame]
     events: Optional[Dict[str, pd.DataFrame]]
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "data_dictionary":
+            self._invalidate_field_index()
+
     def __post_init__(self) -> None:
         self.validate()
+        self.data_dictionary = self.data_dictionary.astype(
+            {
+                column: "category"
+                for column in _CATEGORY_COLUMNS
+                if column in self.data_dictionary.columns
+            }
+        )
+        self._build_field_index()
 
     def validate(self) -> None:
         """Validation of all data."""
@@ -57,19 +76,27 @@ class IsaricData:
 
         Raises:
             TypeError: If data_dictionary is not a pandas DataFrame.
+            ValueError: If field_names don't conform to schema or are not unique.
         """
         if not isinstance(self.data_dictionary, pd.DataFrame):
             raise TypeError("data_dictionary must be a pandas DataFrame")
 
-        field_name_check = self.data_dictionary["field_name"].apply(
-            lambda x: x != sanitise_string(x) or not str(x)[0].isalpha()
+        field_name_check = ~self.data_dictionary["field_name"].str.fullmatch(
+            _FIELD_NAME_RE, na=False
         )
         if field_name_check.any():
             field_names = ", ".join(
-                self.data_dictionary.loc[field_name_check, "field_name"]
+                self.data_dictionary.loc[field_name_check, "field_name"].astype(str)
             )
             raise ValueError(f"field_names ({field_names}) don't conform to schema")
 
+        duplicated = self.data_dictionary["field_name"].duplicated()
+        if duplicated.any():
+            field_names = ", ".join(
+                self.data_dictionary.loc[duplicated, "field_name"].unique()
+            )
+            raise ValueError(f"field_names ({field_names}) are not unique")
+
     def validate_table(self, table_name: str) -> None:
         """Validation of a named table.
 
@@ -84,13 +111,41 @@ class IsaricData:
         """Print a summary of the instance. TODO."""
         return
 
+    def _build_field_index(self) -> None:
+        """Map each field_name to its row position in data_dictionary."""
+        field_names = self.data_dictionary["field_name"].to_numpy()
+        self._field_row_idx = dict(zip(field_names, range(len(field_names))))
+
+    def _invalidate_field_index(self) -> None:
+        """Drop the field_name index. Called whenever data_dictionary is
+        reassigned."""
+        self._field_row_idx = None
+
+    def _field_idx(self, field_name: str) -> int:
+        """Row position of a field in data_dictionary.
+
+        Raises:
+            KeyError: If field_name is not in data_dictionary.
+        """
+        if self._field_row_idx is None:
+            self._build_field_index()
+        idx = self._field_row_idx.get(field_name)
+        field_names = self.data_dictionary["field_name"]
+        if idx is None or idx >= len(field_names) or field_names.iat[idx] != field_name:
+            # data_dictionary may have been edited in place since the index was built
+            self._build_field_index()
+            idx = self._field_row_idx[field_name]
+        return idx
+
     def get_field_options(self, field_name: str) -> List[Any]:
         """Currently field options stored as a JSON-string inside a pandas dataframe.
-        TODO."""
-        mask = self.data_dictionary["field_name"] == field_name
-        s = self.data_dictionary.loc[mask, "field_options"].item()
-        field_options = json.loads(s) if pd.notna(s) and s.strip() else []
-        return field_options
+        TODO.
+
+        Raises:
+            KeyError: If field_name is not in data_dictionary.
+        """
+        s = self.data_dictionary["field_options"].iat[self._field_idx(field_name)]
+        return json.loads(s) if pd.notna(s) and s.strip() else []
 
     def get_subject(self, subjid: str, table_name: str) -> pd.DataFrame:
         return
@@ -99,13 +154,25 @@ class IsaricData:
         return
 
     def get_field_names(
-        self, field_types: List[str], table_names: List[str]
-    ) -> List[str]:
-        """Get field names by field types and/or table names. TODO properly"""
+        self, field_types: List[str], table_names: List[str], as_set: bool = False
+    ) -> Union[List[str], FrozenSet[str]]:
+        """Get field names by field types and/or table names. TODO properly
+
+        Args:
+            field_types: field types to include.
+            table_names: table names to include.
+            as_set: if True, return a frozenset for fast membership tests.
+
+        Returns:
+            A list of field names in data_dictionary order, or a frozenset.
+        """
         mask = self.data_dictionary["field_type"].isin(
             field_types
         ) & self.data_dictionary["table_name"].isin(table_names)
-        return self.data_dictionary.loc[mask, "field_name"].tolist()
+        field_names = self.data_dictionary.loc[mask, "field_name"]
+        if as_set:
+            return frozenset(field_names)
+        return field_names.tolist()
 
     def add_derived_field(
         self, field_name: str, table_name: str, **kwargs
@@ -122,26 +189,30 @@ class IsaricData:
 
     def copy(self, table_names: Optional[List[str]] = None) -> "IsaricData":
         """
-        Return a deep copy of this IsaricData instance.
+        Return a copy of this IsaricData instance.
+
+        When pandas copy-on-write is enabled (``pd.options.mode.copy_on_write =
+        True``), DataFrames are copied shallowly and their data is only duplicated
+        when one of the copies is modified. Otherwise they are deep copied.
 
         Args:
             table_names:
                 Optional list of attribute names that correspond to pandas DataFrames.
-                If None, deep copy all attributes that are pandas DataFrames.
+                If None, copy all attributes that are pandas DataFrames.
 
         Returns:
             A new IsaricData instance with copied attributes.
         """
         # create a new empty instance, avoid re-running __init__
         new = self.__class__.__new__(self.__class__)
+        # copy_on_write may also be "warn", which doesn't defer copies
+        deep = pd.options.mode.copy_on_write is not True
 
         for name, value in self.__dict__.items():
-            if (
-                isinstance(value, pd.DataFrame)
-                and table_names is None
-                or name in table_names
+            if isinstance(value, pd.DataFrame) and (
+                table_names is None or name in table_names
             ):
-                new.__dict__[name] = value.copy(deep=True)
+                new.__dict__[name] = value.copy(deep=deep)
 
             elif isinstance(value, dict):
                 new.__dict__[name] = deepcopy(value)
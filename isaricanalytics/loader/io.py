@@ -15,16 +15,91 @@ object and runs the validation method of `IsaricData` dataclass.
 """
 
 import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 from isaricanalytics.data import IsaricData
 from isaricanalytics.logger import setup_logger
 
+try:
+    import orjson
+except ImportError:  # optional, see `_json_loads`
+    orjson = None
+
 logger = setup_logger(__name__)
 
+# Bytes per block handed to each PyArrow CSV parsing thread
+_CSV_BLOCK_SIZE = 8 << 20
+# Maximum number of data files read concurrently by `load_data_from_file`
+_MAX_LOAD_WORKERS = 8
+# Parquet schema metadata key identifying the file a cached data dictionary came from
+_CACHE_KEY = b"isaricanalytics.source"
+# ISO 8601 timestamp ending in a UTC offset, e.g. "2025-03-25T10:00:00+02:00"
+_UTC_OFFSET_PATTERN = r"[T ].*(?:Z|[+-]\d{2}(?::?\d{2})?)$"
+
+
+def _json_loads(text: str) -> Any:
+    """Parse a JSON document, using the faster ``orjson`` parser if installed.
+
+    Documents that ``orjson`` rejects (e.g. with NaN literals or integers beyond 64
+    bits) are parsed again by :mod:`json`, so the same documents are accepted and the
+    same :class:`json.JSONDecodeError` is raised either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def _dedupe_column_names(names: List[str]) -> List[str]:
+    """Rename repeated column names the way :func:`pandas.read_csv` does, by
+    appending a counter, e.g. ``["a", "a", "a"]`` becomes ``["a", "a.1", "a.2"]``.
+    Names already in the header are skipped."""
+    header = set(names)
+    counts: Dict[str, int] = {}
+    deduped = []
+    for name in names:
+        column = name
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[name] = count + 1
+            column = f"{name}.{count}"
+            count = count + 1 if column in header else counts.get(column, 0)
+        counts[column] = count + 1
+        deduped.append(column)
+    return deduped
+
+
+def _parse_datetime(series: pd.Series) -> pd.Series:
+    """Parse ISO 8601 strings as datetime64[ns]. Values with a UTC offset are
+    converted to UTC and the result has no time zone; invalid or out-of-range
+    values become NaT."""
+    has_offset = series.str.contains(_UTC_OFFSET_PATTERN, na=False)
+    if has_offset.all() or not has_offset.any():
+        parsed = pd.to_datetime(
+            series, errors="coerce", format="ISO8601", utc=True, cache=True
+        )
+    else:
+        # pandas applies an offset to naive values parsed after it, so parse values
+        # with and without offsets separately
+        parsed = pd.Series(pd.NaT, index=series.index, dtype="datetime64[ns, UTC]")
+        for mask in (has_offset, ~has_offset):
+            parsed[mask] = pd.to_datetime(
+                series[mask], errors="coerce", format="ISO8601", utc=True, cache=True
+            )
+    return parsed.dt.tz_localize(None)
+
 
 class Loader:
     """Utility class for loading project metadata, data dictionary and data.
@@ -34,7 +109,8 @@ class Loader:
     data and data dictionary. These are usual in the same directory.
 
     Args:
-        path: Directory that contains project files (at least ``metadata.json``).
+        path: Directory that contains project files (at least ``metadata.json``),
+          as a string or path-like object.
         encoding: Default text encoding used when reading JSON and
           CSV files. Defaults to ``"utf-8"``.
 
@@ -48,24 +124,83 @@ class Loader:
           Loaded using :method:`load_data_dictionary`.
 
     Raises:
+        TypeError: If ``path`` is not a string or path-like, or ``encoding`` is not a
+          string.
         FileNotFoundError: If ``path`` does not exist or is not a directory.
     """
 
-    def __init__(self, path: str, encoding: str = "utf-8") -> None:
-        if not isinstance(path, str):
-            raise TypeError("path must be string-valued")
+    def __init__(self, path: Union[str, os.PathLike], encoding: str = "utf-8") -> None:
+        if not isinstance(path, (str, os.PathLike)):
+            raise TypeError("path must be a string or path-like")
         if not isinstance(encoding, str):
             raise TypeError("encoding must be string-valued")
-        self.path = Path(path)
+        self.path = path if isinstance(path, Path) else Path(path)
         self.encoding = encoding
 
         if not self.path.is_dir():
             raise FileNotFoundError(self.path)
 
         self.metadata: Optional[Dict[str, Any]] = None
-        self.data_dictionary: Optional[pd.DataFrame] = None
+        self.data_dictionary = None
+        self._dir_index: Optional[Dict[str, os.DirEntry]] = None
         logger.info("Set project path to %s", path)
 
+    @property
+    def data_dictionary(self) -> Optional[pd.DataFrame]:
+        return self._data_dictionary
+
+    @data_dictionary.setter
+    def data_dictionary(self, data_dictionary: Optional[pd.DataFrame]) -> None:
+        # Replacing the data dictionary invalidates the field lookup
+        self._data_dictionary = data_dictionary
+        self._field_index: Optional[Dict[str, Dict[str, List[str]]]] = None
+
+    def _table_fields(self, table_name: str) -> Dict[str, List[str]]:
+        """Field names of a table in the data dictionary, keyed by field type.
+
+        The lookup for all tables is built on first use from a single groupby.
+        """
+        if self._field_index is None:
+            grouped = self.data_dictionary.groupby(
+                ["table_name", "field_type"], sort=False, observed=True
+            )["field_name"].agg(list)
+            field_index = {}
+            for (table, field_type), field_names in grouped.items():
+                field_index.setdefault(table, {})[field_type] = field_names
+            self._field_index = field_index
+        return self._field_index.get(table_name, {})
+
+    def _index_directory(self) -> None:
+        """List the project directory once, so that :method:`_file_path` can look
+        up files without a ``stat`` call per file. Names not found in the listing
+        are still checked on disk."""
+        with os.scandir(self.path) as entries:
+            self._dir_index = {entry.name: entry for entry in entries}
+
+    def _file_path(self, filename: str) -> Path:
+        """Path of a file in the project directory.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        file_path = self.path / filename
+        if self._dir_index is not None and file_path.parent == self.path:
+            # Fall back on the filesystem for e.g. case-insensitive matches or files
+            # added since the directory was listed
+            exists = file_path.name in self._dir_index or file_path.exists()
+        else:
+            exists = file_path.exists()
+        if not exists:
+            raise FileNotFoundError(file_path)
+        return file_path
+
+    def _file_meta(self, name: str) -> Dict[str, Any]:
+        """Metadata of a named file, from ``metadata['files']`` or (for an events
+        dataframe) ``metadata['files']['events']``. Empty if there is none."""
+        files = self.metadata.get("files", {})
+        # If an events dataframe, then need to go one level deeper in the metadata
+        return files.get(name) or files.get("events", {}).get(name) or {}
+
     def load_metadata(self) -> Dict[str, Any]:
         """Load and parse ``metadata.json``.
 
@@ -75,14 +210,11 @@ class Loader:
         Raises:
             FileNotFoundError: If the metadata file does not exist in the directory.
         """
-        metadata_path = self.path / "metadata.json"
-
-        if not metadata_path.exists():
-            raise FileNotFoundError(metadata_path)
+        metadata_path = self._file_path("metadata.json")
 
-        with open(metadata_path, "r", encoding=self.encoding) as json_data:
-            self.metadata = json.load(json_data)
-            logger.info("Loaded project metadata.")
+        text = metadata_path.read_bytes().decode(self.encoding)
+        self.metadata = _json_loads(text)
+        logger.info("Loaded project metadata.")
 
         # Get path specified in metadata, must match path specified on init if present
         path_from_metadata = self.metadata.get("path", None)
@@ -93,9 +225,15 @@ class Loader:
             raise ValueError("metadata field `path` must equal :attr:`path`")
         return self.metadata
 
-    def load_data_dictionary(self) -> pd.DataFrame:
+    def load_data_dictionary(self, cache: bool = False) -> pd.DataFrame:
         """Load the project data dictionary.
 
+        Args:
+            cache: If True, keep a parsed copy of the data dictionary in a hidden
+              Parquet file next to it (e.g. ``.data_dictionary.csv.parquet``) and
+              read from that on later loads, as long as the .csv file's size and
+              modification time are unchanged.
+
         Returns:
             Data dictionary as a pandas.DataFrame.
 
@@ -112,37 +250,32 @@ class Loader:
                 "metadata must be loaded first (using :method:`load_metadata`)"
             )
 
-        filename = (
-            self.metadata.get("files", {})
-            .get("data_dictionary", {})
-            .get("filename", "data_dictionary.csv")
-        )
+        file_metadata = self._file_meta("data_dictionary")
+
+        filename = file_metadata.get("filename", "data_dictionary.csv")
         if not isinstance(filename, str):
             raise TypeError(
                 "metadata key 'files.data_dictionary.filename' must be string-valued "
                 "if it exists"
             )
 
-        encoding = (
-            self.metadata.get("files", {})
-            .get("data_dictionary", {})
-            .get("encoding", self.encoding)
-        )
+        encoding = file_metadata.get("encoding", self.encoding)
         if not isinstance(encoding, str):
             raise TypeError(
                 "metadata key 'files.data_dictionary.encoding' must be string-valued "
                 "if it exists"
             )
 
-        data_dictionary_path = self.path / filename
-        if not data_dictionary_path.exists():
-            raise FileNotFoundError(data_dictionary_path)
+        data_dictionary_path = self._file_path(filename)
 
-        data_dictionary = pd.read_csv(
-            data_dictionary_path,
-            dtype=str,
-            encoding=encoding,
-        )
+        if cache:
+            data_dictionary = self._read_cached_csv(data_dictionary_path, encoding)
+        else:
+            data_dictionary = pd.read_csv(
+                data_dictionary_path,
+                dtype=str,
+                encoding=encoding,
+            )
 
         self.data_dictionary = data_dictionary
 
@@ -150,13 +283,62 @@ class Loader:
         logger.info("Loaded project data_dictionary.")
         return self.data_dictionary
 
+    def _read_cached_csv(self, csv_path: Path, encoding: str) -> pd.DataFrame:
+        """Read an all-string .csv file through a Parquet cache next to it.
+
+        The cache is keyed on the size, modification time and encoding of the .csv
+        file, and is rewritten (atomically) whenever these change.
+        """
+        stat = csv_path.stat()
+        key = json.dumps([stat.st_mtime_ns, stat.st_size, encoding]).encode()
+        cache_path = csv_path.with_name(f".{csv_path.name}.parquet")
+
+        try:
+            if (pq.read_schema(cache_path).metadata or {}).get(_CACHE_KEY) == key:
+                df = pq.read_table(cache_path).to_pandas()
+                logger.info("Read %s from cache %s.", csv_path.name, cache_path)
+                # Parquet returns missing strings as None rather than NaN
+                return df.where(df.notna(), np.nan)
+        except (OSError, pa.ArrowException):
+            pass  # no cache yet, or unreadable: fall back to the .csv file
+
+        df = pd.read_csv(csv_path, dtype=str, encoding=encoding)
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata(
+            {**table.schema.metadata, _CACHE_KEY: key}
+        )
+        # Write to a temporary file first so a partly written cache is never read
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=cache_path.parent, suffix=".tmp", delete=False
+            ) as tmp:
+                tmp_path = tmp.name
+                pq.write_table(table, tmp)
+            os.replace(tmp_path, cache_path)
+        except (OSError, pa.ArrowException) as e:
+            logger.warning("Could not write cache %s: %s", cache_path, e)
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return df
+
     def load_df(self, name: str) -> pd.DataFrame:
         """Load a dataframe using project metadata and data dictionary.
 
         Both metadata and data dictionary must be loaded before. The data dictionary
         should provide dtypes of the data. Text/categorical variables are treated as
-        strings when the file is read. Datetime columns are converted to dtype
-        datetime64[ns] after reading.
+        strings when the file is read, and string columns use the PyArrow-backed
+        ``string[pyarrow]`` dtype. Datetime columns are converted to dtype
+        datetime64[ns] after reading; values that are not ISO 8601 (as required by
+        the data schema) become NaT. Values with a UTC offset are converted to
+        UTC, and the column has no time zone.
+
+        Files are parsed with the multithreaded PyArrow CSV reader. Empty cells are
+        read as missing values. Other columns have their types inferred by PyArrow.
+        Those it reads as dates or timestamps are converted in the same way as
+        datetime columns, and times of day are kept as strings. Repeated column
+        names get a numeric suffix as in :func:`pandas.read_csv`, e.g. ``a.1``.
 
         Args:
             name: name of the dataframe to load (must be present in
@@ -184,13 +366,7 @@ class Loader:
                 "(using :method:`load_data_dictionary`)"
             )
 
-        file_metadata = self.metadata.get("files", {}).get(name, {})
-        # If an events dataframe, then need to go one level deeper in the metadata
-        if not file_metadata:
-            file_metadata = (
-                self.metadata.get("files", {}).get("events", {}).get(name, {})
-            )
-
+        file_metadata = self._file_meta(name)
         if not file_metadata:
             logger.warning(
                 "dataframe %s is not listed as a file in metadata.json "
@@ -213,39 +389,59 @@ class Loader:
                 "exists"
             )
 
-        data_path = self.path / filename
-        if not data_path.exists():
-            raise FileNotFoundError(data_path)
+        data_path = self._file_path(filename)
 
-        str_mask = (self.data_dictionary["table_name"] == name) & (
-            self.data_dictionary["field_type"].isin(["freetext", "categorical"])
-        )
-        str_variables = self.data_dictionary.loc[str_mask, "field_name"].tolist()
-        dtype_dict = {x: str for x in str_variables}
-        na_values = {x: "" for x in str_variables}
+        fields = self._table_fields(name)
+        str_variables = fields.get("freetext", []) + fields.get("categorical", [])
+        # Datetime fields are read as strings and parsed by pandas below, so that
+        # invalid or out-of-range values become NaT
+        date_variables = list(fields.get("datetime", []))
+        column_types = {x: pa.string() for x in str_variables + date_variables}
 
-        df = pd.read_csv(
+        table = pacsv.read_csv(
             data_path,
-            dtype=dtype_dict,
-            keep_default_na=False,
-            na_values=na_values,
-            encoding=encoding,
+            read_options=pacsv.ReadOptions(
+                encoding=encoding, block_size=_CSV_BLOCK_SIZE
+            ),
+            # Quoted values (e.g. freetext) may span several lines
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types=column_types,
+                null_values=[""],
+                strings_can_be_null=True,
+            ),
+        )
+        column_names = _dedupe_column_names(table.column_names)
+        if column_names != table.column_names:
+            logger.warning("Renamed repeated column names in %s", filename)
+            table = table.rename_columns(column_names)
+
+        # Cast undeclared dates and timestamps back to strings, to be parsed with the
+        # datetime fields below, and keep times of day as strings
+        for i, field in enumerate(table.schema):
+            if pa.types.is_date(field.type) or pa.types.is_timestamp(field.type):
+                date_variables.append(field.name)
+            elif not pa.types.is_time(field.type):
+                continue
+            table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+
+        df = table.to_pandas(
+            types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get,
+            split_blocks=True,
+            self_destruct=True,
         )
 
         # Convert datetime variables
-        date_mask = (self.data_dictionary["table_name"] == name) & (
-            self.data_dictionary["field_type"] == "datetime"
-        )
-        date_variables = self.data_dictionary.loc[date_mask, "field_name"].tolist()
-        df[date_variables] = df[date_variables].apply(
-            lambda x: pd.to_datetime(x, errors="coerce")
-        )
+        for col in date_variables:
+            df[col] = _parse_datetime(df[col])
 
         logger.info("Loaded project dataframe: %s.", name)
         return df
 
 
-def load_data_from_file(path: str, validate: bool = True) -> IsaricData:
+def load_data_from_file(
+    path: Union[str, os.PathLike], validate: bool = True
+) -> IsaricData:
     """Wrapper function to load project data into `IsaricData` instance
     and validates this using the validate method of the `IsaricData` class.
 
@@ -261,16 +457,32 @@ def load_data_from_file(path: str, validate: bool = True) -> IsaricData:
         >>> data.presentation.head()
     """
     loader = Loader(path=path)
+    loader._index_directory()
     metadata = loader.load_metadata()
     data_dictionary = loader.load_data_dictionary()
 
-    presentation = loader.load_df(name="presentation")
-    outcome = loader.load_df(name="outcome")
-    daily = loader.load_df(name="daily")  # may return None if not present in metadata
-
+    table_names = ["presentation", "outcome", "daily"]
     events_metadata = metadata.get("files", {}).get("events", {})
+
+    # Parsing releases the GIL, so files are read concurrently. The only loader state
+    # `load_df` writes is the lazily built field lookup, which is safe to race on.
+    n_files = len(table_names) + len(events_metadata)
+    with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, n_files)) as executor:
+        table_futures = {
+            name: executor.submit(loader.load_df, name=name) for name in table_names
+        }
+        event_futures = {
+            name: executor.submit(loader.load_df, name=name)
+            for name in events_metadata.keys()
+        }
+
+    presentation = table_futures["presentation"].result()
+    outcome = table_futures["outcome"].result()
+    # may return None if not present in metadata
+    daily = table_futures["daily"].result()
+
     if events_metadata:  # i.e. a non-empty dict
-        events = {name: loader.load_df(name=name) for name in events_metadata.keys()}
+        events = {name: future.result() for name, future in event_futures.items()}
 
     data = IsaricData(
         metadata=metadata,
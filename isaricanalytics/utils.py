@@ -3,11 +3,19 @@
 utils.py: General helper functions.
 """
 
+import functools
 import re
+from collections import Counter
 
 import pandas as pd
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_SANITISE_RE = re.compile(r"[^0-9a-z_]")
+# Strings that `sanitise_string` leaves unchanged
+_SANITISED_RE = re.compile(r"[0-9a-z_]+")
 
+
+@functools.lru_cache(maxsize=65536, typed=True)
 def sanitise_string(string: str) -> str:
     """Replaces uppercase with lowercase, spaces with underscores and then removes
     all characters except lowercase  alphanumeric and underscores.
@@ -19,8 +27,23 @@ def sanitise_string(string: str) -> str:
         Modified string.
     """
     s = str(string).strip().lower()
-    s = re.sub(r"\s+", "_", s)
-    s = re.sub(r"[^0-9a-z_]", "", s)
+    s = _WHITESPACE_RE.sub("_", s)
+    s = _SANITISE_RE.sub("", s)
+    return s
+
+
+def sanitise_string_vec(series: pd.Series) -> pd.Series:
+    """Vectorised version of `sanitise_string`, applied to every value in a Series.
+
+    Args:
+        series: a pandas Series, values are converted to strings.
+
+    Returns:
+        A Series of sanitised strings with the same index.
+    """
+    s = series.astype(str).str.strip().str.lower()
+    s = s.str.replace(_WHITESPACE_RE, "_", regex=True)
+    s = s.str.replace(_SANITISE_RE, "", regex=True)
     return s
 
 
@@ -34,21 +57,26 @@ def sanitise_field(field: pd.Series) -> pd.Series:
         A modified field with sanitised values
         A dict of the sanitised and original values (as key-value pairs in that order).
     """
-    mapping_df = pd.DataFrame.from_dict(
-        {value: sanitise_string(value) for value in field},
-        orient="index",
-        columns=["clean"],
-    ).reset_index()
+    values = field.unique()
+
+    # Nothing to rename if every value is already sanitised (and so unique)
+    if all(isinstance(v, str) and _SANITISED_RE.fullmatch(v) for v in values):
+        return field.copy(), {value: value for value in values}
 
     # Make sure sanitised strings are unique by adding an incremental suffix
-    mapping_df["clean"] = mapping_df["clean"].str.cat(
-        mapping_df.groupby("clean").cumcount().astype(str),
-        sep="__",
-    )
     # Only need to append a suffix to repeating sanitised strings
-    mapping_df["clean"] = mapping_df["clean"].apply(lambda x: re.sub("\\__0", "", x))
+    mapping = {}
+    counts = Counter()
+    for value in values:
+        clean = sanitise_string(value)
+        n = counts[clean]
+        counts[clean] += 1
+        mapping[value] = clean if n == 0 else f"{clean}__{n}"
 
-    mapping = mapping_df.set_index("index").to_dict()["clean"]
-    sanitised_field = field.replace(mapping)
+    # Every value has a mapping, so no need to fall back on the original values
+    sanitised_field = field.map(mapping)
+    if isinstance(field.dtype, pd.StringDtype):
+        # map returns object dtype, so restore e.g. string[pyarrow]
+        sanitised_field = sanitised_field.astype(field.dtype)
 
     return sanitised_field, mapping
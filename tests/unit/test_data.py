@@ -63,3 +63,110 @@ def test_post_init():
             presentation=presentation,
             outcome=None,  # type: ignore[arg-type]
         )
+
+
+def load_fixture_data() -> IsaricData:
+    return IsaricData(
+        metadata=load_fixture_metadata(),
+        data_dictionary=load_fixture_csv("data_dictionary", dtype=str),
+        presentation=load_fixture_csv("presentation"),
+        outcome=load_fixture_csv("outcome"),
+        daily=load_fixture_csv("daily"),
+        events={"medication": load_fixture_csv("events_medication")},
+    )
+
+
+@pytest.mark.unit
+def test_validate_data_dictionary():
+    data = load_fixture_data()
+
+    data.data_dictionary.loc[0, "field_name"] = "Subject ID"
+    with pytest.raises(ValueError):
+        data.validate_data_dictionary()
+
+    data.data_dictionary.loc[0, "field_name"] = None
+    with pytest.raises(ValueError):
+        data.validate_data_dictionary()
+
+    data.data_dictionary.loc[0, "field_name"] = "phase"
+    with pytest.raises(ValueError):
+        data.validate_data_dictionary()
+
+
+@pytest.mark.unit
+def test_data_dictionary_dtypes():
+    data = load_fixture_data()
+    assert data.data_dictionary["field_name"].dtype == object
+    for column in ("table_name", "field_type"):
+        assert isinstance(data.data_dictionary[column].dtype, pd.CategoricalDtype)
+
+    assert data.get_field_names(["datetime"], ["presentation"]) == ["pres_date"]
+    assert data.get_field_names(["datetime"], ["not_a_table"]) == []
+    assert data.get_field_names(
+        ["categorical", "categorical_ynu"], ["presentation"], as_set=True
+    ) == frozenset(
+        [
+            "source_dataset_id",
+            "source_dataset_disease",
+            "pres_adm",
+            "demog_sex",
+            "demog_country_iso3",
+        ]
+    )
+
+    # Columns missing from the data dictionary are skipped
+    data = IsaricData(
+        metadata=load_fixture_metadata(),
+        data_dictionary=load_fixture_csv("data_dictionary")[["field_name"]],
+        presentation=load_fixture_csv("presentation"),
+        outcome=load_fixture_csv("outcome"),
+        daily=None,
+        events=None,
+    )
+    assert data.data_dictionary.columns.tolist() == ["field_name"]
+
+
+@pytest.mark.unit
+def test_get_field_options():
+    data = load_fixture_data()
+    assert data.get_field_options("demog_sex") == ["Male", "Female", "Other", "Unknown"]
+    assert data.get_field_options("demog_age_years") == []
+
+    with pytest.raises(KeyError):
+        data.get_field_options("not_a_field")
+
+
+@pytest.mark.unit
+def test_field_index_data_dictionary_changes():
+    data = load_fixture_data()
+    sex_options = data.get_field_options("demog_sex")
+
+    # Reassigning data_dictionary rebuilds the field_name index
+    data.data_dictionary = data.data_dictionary.iloc[::-1].reset_index(drop=True)
+    assert data.get_field_options("demog_sex") == sex_options
+    assert data.get_field_options("demog_age_years") == []
+
+    # So do in-place edits of field_name
+    idx = data.data_dictionary.index[data.data_dictionary["field_name"] == "demog_sex"]
+    data.data_dictionary.loc[idx, "field_name"] = "demog_gender"
+    assert data.get_field_options("demog_gender") == sex_options
+    with pytest.raises(KeyError):
+        data.get_field_options("demog_sex")
+
+
+@pytest.mark.unit
+def test_copy():
+    data = load_fixture_data()
+
+    # Without copy-on-write (including its "warn" mode) DataFrames are deep copied
+    for copy_on_write in (False, "warn", True):
+        with pd.option_context("mode.copy_on_write", copy_on_write):
+            new = data.copy()
+            assert new.presentation.equals(data.presentation)
+            new.presentation.loc[0, "demog_age_years"] = -1
+            assert data.presentation.loc[0, "demog_age_years"] != -1
+    assert new.metadata == data.metadata and new.metadata is not data.metadata
+
+    new = data.copy(table_names=["presentation"])
+    assert new.presentation is not data.presentation
+    assert new.outcome is data.outcome
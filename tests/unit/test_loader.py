@@ -1,4 +1,5 @@
 import json
+import shutil
 import tempfile
 from pathlib import Path
 
@@ -6,7 +7,7 @@ import pandas as pd
 import pytest
 
 from isaricanalytics.data.core import IsaricData
-from isaricanalytics.loader.io import Loader, load_data_from_file
+from isaricanalytics.loader.io import Loader, _json_loads, load_data_from_file
 
 FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "data"
 
@@ -19,6 +20,10 @@ def test_loader_init():
     assert loader.metadata is None
     assert loader.data_dictionary is None
 
+    # Path objects are accepted as well as strings
+    loader = Loader(path=FIXTURES)
+    assert loader.path is FIXTURES
+
     alt_encoding = "latin-1"
     loader = Loader(path=str(FIXTURES), encoding=alt_encoding)
     assert loader.encoding == alt_encoding
@@ -67,6 +72,15 @@ def test_loader_metadata_json():
             loader.load_metadata()
 
 
+def test_json_loads():
+    """JSON accepted by :mod:`json` is parsed the same with or without orjson."""
+    assert _json_loads('{"a": [1, null, "b"]}') == {"a": [1, None, "b"]}
+    big = 2**70
+    assert _json_loads(f'{{"a": {big}}}') == {"a": big}
+    with pytest.raises(json.JSONDecodeError):
+        _json_loads('{"a": 1,}')
+
+
 def test_loader_metadata_path():
     """:method:`load_metadata` raises exception if field `path` is invalid"""
     # Invalid JSON
@@ -145,6 +159,33 @@ def test_loader_data_dictionary():
         loader.load_data_dictionary()
 
 
+def test_loader_data_dictionary_cache():
+    """:method:`load_data_dictionary` with ``cache=True`` writes a Parquet cache,
+    reads it back identically, and refreshes it when the .csv file changes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        shutil.copy(FIXTURES / "data_dictionary.csv", tmpdir)
+        cache_path = tmpdir / ".data_dictionary.csv.parquet"
+
+        loader = Loader(path=str(tmpdir))
+        loader.metadata = {"files": {}}
+        expected = loader.load_data_dictionary()
+
+        assert loader.load_data_dictionary(cache=True).equals(expected)
+        assert cache_path.exists()
+        cached = loader.load_data_dictionary(cache=True)
+        assert cached.equals(expected)
+        assert cached["field_unit"].isna().sum() == expected["field_unit"].isna().sum()
+
+        with open(tmpdir / "data_dictionary.csv", "a", encoding="utf-8") as f:
+            f.write("new_field,New field,number,,,,,,presentation,\n")
+        assert loader.load_data_dictionary(cache=True).equals(
+            loader.load_data_dictionary()
+        )
+        assert "new_field" in loader.data_dictionary["field_name"].tolist()
+        assert list(tmpdir.glob("*.tmp")) == []
+
+
 def test_loader_df():
     """:method:`load_df` imports correctly.
     Further tests against each table schema are in test_data.py"""
@@ -164,7 +205,9 @@ def test_loader_df():
     assert "field_type" in loader.data_dictionary.columns
     assert "field_name" in loader.data_dictionary.columns
 
-    assert isinstance(loader.load_df("presentation"), pd.DataFrame)
+    presentation = loader.load_df("presentation")
+    assert isinstance(presentation, pd.DataFrame)
+    assert presentation["demog_sex"].dtype == pd.StringDtype("pyarrow")
 
     assert loader.load_df("fakefile") is None  # file doesn't exist, nothing loaded
 
@@ -182,6 +225,124 @@ def test_loader_df():
         loader.load_df("presentation")
 
 
+def test_loader_table_fields():
+    """Data dictionary field lookup is grouped by table and field type, and reset
+    when the data dictionary is replaced."""
+    loader = Loader(path=str(FIXTURES))
+    loader.load_metadata()
+    loader.load_data_dictionary()
+
+    fields = loader._table_fields("presentation")
+    assert fields["datetime"] == ["pres_date"]
+    assert fields["categorical"] == [
+        "source_dataset_id",
+        "source_dataset_disease",
+        "demog_sex",
+        "demog_country_iso3",
+    ]
+    assert loader._table_fields("fakefile") == {}
+
+    loader.data_dictionary = loader.data_dictionary.iloc[:0]
+    assert loader._table_fields("presentation") == {}
+
+
+def test_loader_df_datetime():
+    """Datetime fields are parsed as ISO 8601, invalid values become NaT."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        (tmpdir / "data_dictionary.csv").write_text(
+            "field_name,field_type,table_name\n"
+            "subjid,string,presentation\n"
+            "pres_date,datetime,presentation\n"
+            "adm_date,datetime,presentation\n"
+        )
+        # other_* are not in the data dictionary, so their types are inferred
+        (tmpdir / "presentation.csv").write_text(
+            "subjid,pres_date,other_date,adm_date,other_timestamp,other_time\n"
+            "a,2025-03-25,2025-03-25,2025-03-25T10:00:00+02:00,"
+            "2025-03-25T10:00:00Z,10:30:00\n"
+            "b,2025-03-26T10:30:00,0202-03-25,2025-03-25T10:00:00,"
+            "2025-03-25T11:00:00Z,11:00:00\n"
+            "c,not a date,2025-03-25,2025-03-25T10:00:00Z,,\n"
+            "d,,2025-03-25,,,\n"
+            "e,0202-03-25,2025-03-25,2025-03-25T10:00:00+0530,,\n"
+            "f,,2025-03-25,2025-03-25,,\n"
+        )
+        loader = Loader(path=str(tmpdir))
+        loader.metadata = {"files": {"presentation": {"filename": "presentation.csv"}}}
+        loader.load_data_dictionary()
+        df = loader.load_df("presentation")
+
+    assert df["pres_date"].dtype == "datetime64[ns]"
+    assert df["pres_date"].tolist()[:2] == [
+        pd.Timestamp("2025-03-25"),
+        pd.Timestamp("2025-03-26 10:30:00"),
+    ]
+    # Out-of-range years are NaT, not wrapped around into the datetime64[ns] range
+    assert df["pres_date"].iloc[2:].isna().all()
+    # Inferred dates and timestamps follow the same rules, times of day are strings
+    assert df["other_date"].dtype == "datetime64[ns]"
+    assert pd.isna(df["other_date"].iloc[1])
+    assert df["other_timestamp"].dtype == "datetime64[ns]"
+    assert df["other_timestamp"].tolist()[:2] == [
+        pd.Timestamp("2025-03-25 10:00:00"),
+        pd.Timestamp("2025-03-25 11:00:00"),
+    ]
+    assert isinstance(df["other_time"].dtype, pd.StringDtype)
+    assert df["other_time"].tolist()[:2] == ["10:30:00", "11:00:00"]
+    # Values with and without UTC offsets are combined in UTC
+    assert df["adm_date"].dtype == "datetime64[ns]"
+    assert df["adm_date"].tolist() == [
+        pd.Timestamp("2025-03-25 08:00:00"),
+        pd.Timestamp("2025-03-25 10:00:00"),
+        pd.Timestamp("2025-03-25 10:00:00"),
+        pd.NaT,
+        pd.Timestamp("2025-03-25 04:30:00"),
+        pd.Timestamp("2025-03-25 00:00:00"),
+    ]
+
+
+def test_loader_df_duplicate_columns():
+    """Repeated column names are renamed as by pandas.read_csv."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        (tmpdir / "data_dictionary.csv").write_text(
+            "field_name,field_type,table_name\nsubjid,string,presentation\n"
+        )
+        (tmpdir / "presentation.csv").write_text("subjid,a,a,a\nx,1,2,3\n")
+        loader = Loader(path=str(tmpdir))
+        loader.metadata = {"files": {"presentation": {"filename": "presentation.csv"}}}
+        loader.load_data_dictionary()
+        df = loader.load_df("presentation")
+
+    assert df.columns.tolist() == ["subjid", "a", "a.1", "a.2"]
+    assert df.iloc[0, 1:].tolist() == [1, 2, 3]
+
+
+def test_loader_df_multiline(monkeypatch):
+    """Quoted values spanning several lines are read across parsing blocks."""
+    monkeypatch.setattr("isaricanalytics.loader.io._CSV_BLOCK_SIZE", 64)
+    notes = [f"line one of note {i}\nline two of note {i}" for i in range(20)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        (tmpdir / "data_dictionary.csv").write_text(
+            "field_name,field_type,table_name\n"
+            "subjid,string,presentation\n"
+            "notes,freetext,presentation\n"
+        )
+        (tmpdir / "presentation.csv").write_text(
+            "subjid,notes\n"
+            + "".join(f'{i},"{note}"\n' for i, note in enumerate(notes))
+        )
+        loader = Loader(path=str(tmpdir))
+        loader.metadata = {"files": {"presentation": {"filename": "presentation.csv"}}}
+        loader.load_data_dictionary()
+        df = loader.load_df("presentation")
+
+    assert df["subjid"].tolist() == list(range(20))
+    assert df["notes"].tolist() == notes
+
+
 def test_loader_missing_files():
     """Check if exceptions raised when files are missing."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -199,10 +360,21 @@ def test_loader_missing_files():
         with pytest.raises(FileNotFoundError):
             loader.load_df("presentation")
 
+        # Same when looking files up in a listing of the directory
+        loader._index_directory()
+        with pytest.raises(FileNotFoundError):
+            loader.load_data_dictionary()
+        with pytest.raises(FileNotFoundError):
+            loader.load_df("presentation")
+
+        # Files missing from the listing are still checked on disk
+        (Path(tmpdir) / "metadata.json").write_text("{}")
+        assert loader.load_metadata() == {}
+
 
 def test_loader_wrapper():
     """Check if wrapper works and is an IsaricData object."""
-    data = load_data_from_file(str(FIXTURES))
+    data = load_data_from_file(FIXTURES)
     assert isinstance(data, IsaricData)
 
     # presentation and outcome are required and should be non-empty
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from isaricanalytics.utils import sanitise_field, sanitise_string, sanitise_string_vec
+
+
+def test_sanitise_string():
+    assert sanitise_string("  Discharged  alive ") == "discharged_alive"
+    assert sanitise_string("Oseltamivir (Tamiflu)") == "oseltamivir_tamiflu"
+    assert sanitise_string("already_clean_1") == "already_clean_1"
+    assert sanitise_string(10) == "10"
+    assert sanitise_string(1.0) == "10"
+    assert sanitise_string(True) == "true"
+
+
+def test_sanitise_string_vec():
+    values = ["  Discharged  alive ", "Oseltamivir (Tamiflu)", "a\tb", 10, np.nan]
+    series = pd.Series(values, index=list("abcde"))
+    expected = pd.Series([sanitise_string(x) for x in values], index=series.index)
+    assert sanitise_string_vec(series).equals(expected)
+
+
+def test_sanitise_field():
+    field = pd.Series(["Yes", "No", "yes", "Yes", "Y es", "y_es"])
+    sanitised_field, mapping = sanitise_field(field)
+    assert sanitised_field.tolist() == ["yes", "no", "yes__1", "yes", "y_es", "y_es__1"]
+    assert mapping == {
+        "Yes": "yes",
+        "No": "no",
+        "yes": "yes__1",
+        "Y es": "y_es",
+        "y_es": "y_es__1",
+    }
+
+    # String dtypes are kept
+    field = pd.Series(["Yes", "No", "yes"], dtype=pd.StringDtype("pyarrow"))
+    sanitised_field, _ = sanitise_field(field)
+    assert sanitised_field.dtype == field.dtype
+    assert sanitised_field.tolist() == ["yes", "no", "yes__1"]
+
+    # Values that already contain "__0" are left alone
+    assert sanitise_field(pd.Series(["a__0b"]))[1] == {"a__0b": "a__0b"}
+
+    # Already sanitised values are returned as they are
+    field = pd.Series(["yes", "no", "yes", "y_es__1"])
+    sanitised_field, mapping = sanitise_field(field)
+    assert sanitised_field.equals(field)
+    assert mapping == {"yes": "yes", "no": "no", "y_es__1": "y_es__1"}